@@ -1,3 +1,4 @@
+from . import _bootstrap  # noqa: F401
 import os
 import warnings
 
@@ -0,0 +1,8 @@
+import os
+
+# Set these before any numerical library is imported, they are only read when the
+# thread pools are initialized. This keeps pandas (and the engine workers, which
+# inherit our environment) from multithreading by themselves.
+os.environ.setdefault("OMP_NUM_THREADS", "1")
+os.environ.setdefault("MKL_NUM_THREADS", "1")
+os.environ.setdefault("OPENBLAS_NUM_THREADS", "1")
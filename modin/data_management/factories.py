@@ -14,6 +14,9 @@ class BaseFactory(object):
 
     @classmethod
     def _determine_engine(cls):
+        from modin.pandas._engine import _ensure_started
+
+        _ensure_started()
         if os.environ.get("MODIN_EXPERIMENTAL", "") == "True":
             return ExperimentalBaseFactory._determine_engine()
         factory_name = partition_format + "On" + execution_engine + "Factory"
@@ -235,6 +238,9 @@ class PyarrowOnRayFactory(BaseFactory):
 class ExperimentalBaseFactory(BaseFactory):
     @classmethod
     def _determine_engine(cls):
+        from modin.pandas._engine import _ensure_started
+
+        _ensure_started()
         factory_name = "Experimental{}On{}Factory".format(
             partition_format, execution_engine
         )
@@ -361,9 +361,9 @@ class BaseFrameManager(object):
 
         :return:
         """
-        from modin.pandas import DEFAULT_NPARTITIONS
+        from modin.pandas._engine import get_default_npartitions
 
-        return DEFAULT_NPARTITIONS
+        return get_default_npartitions()
 
     @classmethod
     def _apply_func_to_list_of_partitions(cls, func, partitions, **kwargs):
@@ -230,9 +230,9 @@ class RayIO(BaseIO):
             if len(columns) == 0:
                 return cls.from_pandas(pandas.DataFrame(columns=partitioned_columns))
 
-        from modin.pandas import DEFAULT_NPARTITIONS
+        from modin.pandas._engine import get_default_npartitions
 
-        num_partitions = DEFAULT_NPARTITIONS
+        num_partitions = get_default_npartitions()
         num_splits = min(len(columns), num_partitions)
         # Each item in this list will be a list of column names of the original df
         column_splits = (
@@ -436,9 +436,9 @@ class RayIO(BaseIO):
             dtypes_ids = []
             total_bytes = file_size(f)
             # Max number of partitions available
-            from modin.pandas import DEFAULT_NPARTITIONS
+            from modin.pandas._engine import get_default_npartitions
 
-            num_partitions = DEFAULT_NPARTITIONS
+            num_partitions = get_default_npartitions()
             # This is the number of splits for the columns
             num_splits = min(len(column_names), num_partitions)
             # This is the chunksize each partition will read
@@ -825,9 +825,9 @@ class RayIO(BaseIO):
 
             with file_open(path_or_buf, "rb", kwargs.get("compression", "infer")) as f:
                 total_bytes = file_size(f)
-                from modin.pandas import DEFAULT_NPARTITIONS
+                from modin.pandas._engine import get_default_npartitions
 
-                num_partitions = DEFAULT_NPARTITIONS
+                num_partitions = get_default_npartitions()
                 num_splits = min(len(columns), num_partitions)
                 chunk_size = max(1, (total_bytes - f.tell()) // num_partitions)
 
@@ -940,9 +940,9 @@ class RayIO(BaseIO):
             kwargs["stop"] = stop
             columns = empty_pd_df.columns
 
-        from modin.pandas import DEFAULT_NPARTITIONS
+        from modin.pandas._engine import get_default_npartitions
 
-        num_partitions = DEFAULT_NPARTITIONS
+        num_partitions = get_default_npartitions()
         num_splits = min(len(columns), num_partitions)
         # Each item in this list will be a list of column names of the original df
         column_splits = (
@@ -1004,9 +1004,9 @@ class RayIO(BaseIO):
             fr = FeatherReader(path)
             columns = [fr.get_column_name(i) for i in range(fr.num_columns)]
 
-        from modin.pandas import DEFAULT_NPARTITIONS
+        from modin.pandas._engine import get_default_npartitions
 
-        num_partitions = DEFAULT_NPARTITIONS
+        num_partitions = get_default_npartitions()
         num_splits = min(len(columns), num_partitions)
         # Each item in this list will be a list of column names of the original df
         column_splits = (
@@ -1098,9 +1098,9 @@ class RayIO(BaseIO):
             "SELECT * FROM ({}) as foo LIMIT 0".format(sql), con, index_col=index_col
         )
         cols_names = cols_names_df.columns
-        from modin.pandas import DEFAULT_NPARTITIONS
+        from modin.pandas._engine import get_default_npartitions
 
-        num_partitions = DEFAULT_NPARTITIONS
+        num_partitions = get_default_npartitions()
         partition_ids = []
         index_ids = []
         limit = math.ceil(row_cnt / num_partitions)
@@ -1,6 +1,7 @@
 import pandas
 
 from modin.engines.base.frame.axis_partition import PandasFrameAxisPartition
+from modin.engines.ray.utils import BoundCall
 from .partition import PandasOnRayFramePartition
 from modin import __execution_engine__
 
@@ -25,7 +26,7 @@ class PandasOnRayFrameAxisPartition(PandasFrameAxisPartition):
     ):
         return deploy_ray_func._remote(
             args=(
-                PandasFrameAxisPartition.deploy_axis_func,
+                BoundCall("deploy_axis_func", PandasFrameAxisPartition),
                 axis,
                 func,
                 num_splits,
@@ -42,7 +43,9 @@ class PandasOnRayFrameAxisPartition(PandasFrameAxisPartition):
     ):
         return deploy_ray_func._remote(
             args=(
-                PandasFrameAxisPartition.deploy_func_between_two_axis_partitions,
+                BoundCall(
+                    "deploy_func_between_two_axis_partitions", PandasFrameAxisPartition
+                ),
                 axis,
                 func,
                 num_splits,
@@ -1,4 +1,5 @@
 import builtins
+from operator import attrgetter
 
 
 def handle_ray_task_error(e):
@@ -12,3 +13,28 @@ def handle_ray_task_error(e):
                 else:
                     raise att_err
     raise e
+
+
+def _rebind(name, obj):
+    return attrgetter(name)(obj)
+
+
+class BoundCall(object):
+    """A picklable stand-in for the bound method `obj.name`.
+
+    It unpickles (and calls) as the bound method itself. Passing this to remote
+    functions instead of a raw bound method means Ray 0.7 does not need a custom
+    serializer for `MethodType`.
+    """
+
+    __slots__ = ("name", "obj")
+
+    def __init__(self, name, obj):
+        self.name = name
+        self.obj = obj
+
+    def __call__(self, *args, **kwargs):
+        return _rebind(self.name, self.obj)(*args, **kwargs)
+
+    def __reduce__(self):
+        return _rebind, (self.name, self.obj)
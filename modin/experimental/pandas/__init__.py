@@ -3,6 +3,7 @@ import os
 os.environ["MODIN_EXPERIMENTAL"] = "True"
 from modin.pandas import *  # noqa F401, F403
 from .io_exp import read_sql  # noqa F401
+import modin.pandas
 import warnings
 
 
@@ -11,3 +12,11 @@ warnings.warn(
     "\nPlease note that some of these APIs deviate from pandas in order to "
     "provide improved performance."
 )
+
+
+def __getattr__(name):
+    # `DEFAULT_NPARTITIONS` is not part of `modin.pandas.__all__`, since reading it
+    # starts the engine.
+    if name == "DEFAULT_NPARTITIONS":
+        return modin.pandas.DEFAULT_NPARTITIONS
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
@@ -0,0 +1,331 @@
+import functools
+import importlib
+import os
+import shutil
+import sys
+import threading
+
+import modin
+from modin import __execution_engine__ as execution_engine
+
+# Memory sizes are rounded down to a whole number of gigabytes.
+_GB = 10 ** 9
+
+if execution_engine == "Ray":
+    import ray
+
+    # Querying the cluster is a synchronous round trip to Ray, so start from the
+    # local CPU count and defer the query to `get_num_cpus`.
+    num_cpus = int(os.environ.get("MODIN_CPUS") or os.cpu_count() or 1)
+elif execution_engine in ("Dask", "Python"):
+    num_cpus = 1
+else:
+    raise ImportError("Unrecognized execution engine: {}.".format(execution_engine))
+
+# Whether `num_cpus` has to be taken from the cluster.
+_query_cluster = execution_engine == "Dask" or (
+    execution_engine == "Ray" and not os.environ.get("MODIN_CPUS")
+)
+_started = False
+_start_lock = threading.Lock()
+# Imported in the background while Ray starts up. These are the parts of the API
+# that may not have been loaded yet when the engine is first used.
+_PREFETCH_MODULES = (
+    "modin.pandas.io",
+    "modin.pandas.reshape",
+    "modin.pandas.general",
+    "modin.pandas.datetimes",
+)
+
+
+def _prefetch_modules():
+    """Import the parts of the API that do not touch the execution engine."""
+    for module in _PREFETCH_MODULES:
+        importlib.import_module(module)
+
+
+def _ray_version(ray):
+    """Get the `(major, minor)` version of Ray as a tuple of integers."""
+    return tuple(int(x) for x in ray.__version__.split(".")[:2])
+
+
+def _register_ray_serializers(ray):
+    if _ray_version(ray) < (1, 0):
+        from modin.engines.ray.utils import BoundCall
+
+        # AxisPartition operations ship their methods as `BoundCall` objects.
+        # Older versions of Ray only honor their `__reduce__` through pickle.
+        ray.register_custom_serializer(BoundCall, use_pickle=True)
+
+
+def initialize_ray():
+    """Initializes ray based on environment variables and internal defaults.
+
+    Does nothing if the engine was already started.
+
+    Returns:
+        Whether Ray is ready to be used. Ray can only be started from the main
+        thread, so this is False when called from another thread before Ray was
+        started.
+    """
+    global _started
+    if _started:
+        return True
+    import ray
+
+    if threading.current_thread() is not threading.main_thread():
+        if not ray.is_initialized():
+            return False
+        _register_ray_serializers(ray)
+        _started = True
+        return True
+
+    # Move the standard library ahead of site-packages on the driver and the
+    # workers. This is a hack solution to fix #647, #746
+    def move_stdlib_ahead_of_site_packages(*args):
+        site_packages_path = None
+        site_packages_path_index = -1
+        for i, path in enumerate(sys.path):
+            if sys.exec_prefix in path and path.endswith("site-packages"):
+                site_packages_path = path
+                site_packages_path_index = i
+                # break on first found
+                break
+
+        if site_packages_path is not None:
+            # stdlib packages layout as follows:
+            # - python3.x
+            #   - typing.py
+            #   - site-packages/
+            #     - pandas
+            # So extracting the dirname of the site_packages can point us
+            # to the directory containing standard libraries.
+            stdlib_path = os.path.dirname(site_packages_path)
+            sys.path.insert(site_packages_path_index, stdlib_path)
+            return stdlib_path
+
+    stdlib_path = move_stdlib_ahead_of_site_packages()
+    # Starting Ray takes a while, so import the rest of the API meanwhile.
+    prefetch = threading.Thread(target=_prefetch_modules, daemon=True)
+    prefetch.start()
+    env = {
+        key: os.environ.get(key)
+        for key in (
+            "MODIN_RAY_CLUSTER",
+            "MODIN_REDIS_ADDRESS",
+            "MODIN_MEMORY",
+            "MODIN_OUT_OF_CORE",
+        )
+    }
+    plasma_directory = None
+    cluster = env["MODIN_RAY_CLUSTER"]
+    redis_address = env["MODIN_REDIS_ADDRESS"]
+    init_kwargs = dict(
+        include_webui=False,
+        ignore_reinit_error=True,
+        redis_address=redis_address,
+        logging_level=100,
+    )
+    pythonpath = os.environ.get("PYTHONPATH")
+    # Only a raylet started by this call inherits our environment. Workers of
+    # an already running Ray instance or of a remote cluster do not.
+    starts_local_raylet = (
+        cluster is None and redis_address is None and not ray.is_initialized()
+    )
+    if cluster is None:
+        object_store_memory = env["MODIN_MEMORY"]
+        out_of_core = (env["MODIN_OUT_OF_CORE"] or "False").title() == "True"
+        if out_of_core:
+            # We may have already set the memory from the environment variable, we don't
+            # want to overwrite that value if we have.
+            if object_store_memory is None:
+                # Round down to the nearest Gigabyte.
+                mem_bytes = (ray.utils.get_system_memory() // _GB) * _GB
+                # Default to 8x memory for out of core
+                object_store_memory = 8 * mem_bytes
+        # In case anything failed above, we can still improve the memory for Modin.
+        if object_store_memory is None:
+            # Round down to the nearest Gigabyte.
+            object_store_memory = int(0.6 * ray.utils.get_system_memory()) // _GB * _GB
+            # If the memory pool is smaller than 2GB, just use the default in ray.
+            if object_store_memory == 0:
+                object_store_memory = None
+        else:
+            object_store_memory = int(object_store_memory)
+        if out_of_core:
+            # Ray keeps its objects in shared memory by default, which is much
+            # faster than a disk backed store, so only spill to disk when the
+            # object store does not fit in `/dev/shm`.
+            shm_free = (
+                shutil.disk_usage("/dev/shm").free if os.path.isdir("/dev/shm") else 0
+            )
+            if object_store_memory > shm_free:
+                from tempfile import gettempdir
+
+                plasma_directory = gettempdir()
+        init_kwargs["plasma_directory"] = plasma_directory
+        init_kwargs["object_store_memory"] = object_store_memory
+    if starts_local_raylet and stdlib_path is not None:
+        # The workers are started locally and inherit our environment, so hand
+        # them the fixed up path through `PYTHONPATH` instead of shipping the
+        # function above to every one of them.
+        os.environ["PYTHONPATH"] = os.pathsep.join(
+            [stdlib_path] + ([pythonpath] if pythonpath else [])
+        )
+    # We only start ray in a cluster setting for the head node.
+    if cluster is None or (cluster == "True" and redis_address is not None):
+        try:
+            ray.init(**init_kwargs)
+        finally:
+            if pythonpath is None:
+                os.environ.pop("PYTHONPATH", None)
+            else:
+                os.environ["PYTHONPATH"] = pythonpath
+    prefetch.join()
+    _register_ray_serializers(ray)
+
+    if not starts_local_raylet:
+        # The workers do not share our environment, so the fix still has to be
+        # run on them explicitly.
+        ray.worker.global_worker.run_function_on_all_workers(
+            move_stdlib_ahead_of_site_packages
+        )
+    _started = True
+    return True
+
+
+def _ensure_dask_client():
+    """Get the global dask client, starting a new one if there is none."""
+    # `distributed.client` is expensive to import, so only do it once we know
+    # that a client is needed.
+    get_client = importlib.import_module("distributed.client")._get_global_client
+    client = get_client()
+    if client is None:
+        from distributed import Client
+
+        client = Client()
+    return client
+
+
+def initialize_dask():
+    """Connects to the global dask client, or starts a new one.
+
+    Does nothing if the engine was already started.
+
+    Returns:
+        Whether a dask client is available. A new client is only started from the
+        main thread.
+    """
+    global _started
+    if _started:
+        return True
+    import warnings
+
+    # Not initialized at module level so that the flag survives reloading this
+    # module, and the warning is only shown once per process.
+    if not globals().get("_DASK_WARNED"):
+        warnings.warn("The Dask Engine for Modin is experimental.")
+        globals()["_DASK_WARNED"] = True
+
+    if threading.current_thread() is threading.main_thread():
+        _ensure_dask_client()
+    elif importlib.import_module("distributed.client")._get_global_client() is None:
+        return False
+    _started = True
+    return True
+
+
+def _ensure_started():
+    """Start the execution engine if it has not been started yet.
+
+    This is called on the first use of the engine rather than when `modin.pandas`
+    is imported, so that importing Modin does not start up a cluster.
+    """
+    global _started
+    if _started:
+        return
+    with _start_lock:
+        if _started:
+            return
+        if execution_engine == "Ray":
+            started = initialize_ray()
+        elif execution_engine == "Dask":  # pragma: no cover
+            started = initialize_dask()
+        else:
+            started = True
+        if not started:
+            raise RuntimeError(
+                "The {} engine can only be started from the main thread. Call "
+                "`modin.pandas.start_engine()` from the main thread before using "
+                "Modin from other threads.".format(execution_engine)
+            )
+        _started = True
+
+
+def start_engine():
+    """Start the execution engine now rather than on the first use of Modin.
+
+    The engine can only be started from the main thread, so call this before using
+    Modin from other threads (e.g. a thread pool or a web server's handlers).
+    Starting an engine that is already running does nothing.
+    """
+    _ensure_started()
+
+
+@functools.lru_cache(maxsize=1)
+def _cluster_cpu():
+    if execution_engine == "Ray":
+        return int(ray.cluster_resources()["CPU"])
+    client = importlib.import_module("distributed.client")._get_global_client()
+    return sum(client.ncores().values())
+
+
+def get_num_cpus():
+    """Get the number of CPUs available to Modin.
+
+    The Ray or Dask cluster is only queried the first time this is called. With Ray
+    it is not queried at all if the count was set with the `MODIN_CPUS` environment
+    variable.
+
+    Returns:
+        The number of CPUs.
+    """
+    global num_cpus
+    _ensure_started()
+    if _query_cluster:
+        num_cpus = _cluster_cpu()
+    return num_cpus
+
+
+def refresh_cluster_info():
+    """Forget the cached cluster resources.
+
+    Call this after nodes were added to or removed from the Ray or Dask cluster, so
+    that the next partitioning decision sees the new number of CPUs.
+    """
+    _cluster_cpu.cache_clear()
+    _default_npartitions.cache_clear()
+    modin._default_npartitions = None
+
+
+def get_default_npartitions():
+    """Get the number of partitions Modin splits data into by default.
+
+    A value assigned to `modin.pandas.DEFAULT_NPARTITIONS` takes precedence.
+
+    Returns:
+        The default number of partitions.
+    """
+    override = vars(sys.modules["modin.pandas"]).get("DEFAULT_NPARTITIONS")
+    return _default_npartitions() if override is None else override
+
+
+@functools.lru_cache(maxsize=1)
+def _default_npartitions():
+    # Kept on the top level package so that reloading `modin.pandas` (e.g. with
+    # autoreload) does not query the engine again.
+    npartitions = getattr(modin, "_default_npartitions", None) or max(
+        4, int(get_num_cpus())
+    )
+    modin._default_npartitions = npartitions
+    return npartitions
@@ -1,7 +1,17 @@
 import modin.pandas as pd
 import pandas
+import functools
+import importlib
 import inspect
 import numpy as np
+import pickle
+import pytest
+import subprocess
+import sys
+import textwrap
+import warnings
+
+from modin import __execution_engine__ as execution_engine
 
 
 def test_top_level_api_equality():
@@ -177,3 +187,161 @@ def test_series_api_equality():
 
     print(difference)
     assert not len(difference), "Differences found in API: {}".format(difference)
+
+
+def test_lazy_attribute_resolution():
+    # Forget the name in case another test has already resolved it.
+    vars(pd).pop("wide_to_long", None)
+    assert "wide_to_long" not in vars(pd)
+    assert "wide_to_long" in dir(pd)
+
+    from modin.pandas.reshape import wide_to_long
+
+    assert pd.wide_to_long is wide_to_long
+    assert vars(pd)["wide_to_long"] is wide_to_long
+
+
+def test_unknown_attribute():
+    with pytest.raises(AttributeError):
+        pd.not_a_pandas_function
+
+
+def test_submodules_do_not_shadow_api():
+    from modin.pandas.concat import concat
+    from modin.pandas.plotting import Plotting
+
+    importlib.import_module("modin.pandas.concat")
+    importlib.import_module("modin.pandas.plotting")
+    assert pd.concat is concat
+    assert pd.plotting is Plotting
+
+
+def test_deprecated_sparse_classes():
+    for name in ["SparseSeries", "SparseDataFrame"]:
+        assert name not in pd.__all__
+        assert getattr(pd, name) is getattr(pandas, name)
+
+
+def test_pandas_version_check(monkeypatch):
+    major, minor, patch = map(int, pd.__pandas_version__.split("."))
+    try:
+        monkeypatch.setattr(
+            pandas, "__version__", "{}.{}.{}".format(major, minor, patch + 1)
+        )
+        with warnings.catch_warnings(record=True) as record:
+            warnings.simplefilter("always")
+            importlib.reload(pd)
+        assert not any("pandas version" in str(w.message) for w in record)
+
+        monkeypatch.setattr(pandas, "__version__", "{}.{}.0".format(major, minor + 1))
+        with pytest.warns(UserWarning, match="pandas version"):
+            importlib.reload(pd)
+
+        monkeypatch.setattr(pandas, "__version__", "{}.0.0".format(major + 1))
+        with pytest.raises(ImportError):
+            importlib.reload(pd)
+
+        monkeypatch.setattr(pandas, "__version__", "0+unknown")
+        with pytest.raises(ImportError):
+            importlib.reload(pd)
+    finally:
+        monkeypatch.undo()
+        importlib.reload(pd)
+
+
+def _run_in_new_process(script):
+    # Whether the engine has been started is per process state.
+    subprocess.check_call([sys.executable, "-c", textwrap.dedent(script)])
+
+
+def test_import_does_not_start_engine():
+    _run_in_new_process(
+        """
+        import modin.pandas
+        from modin.pandas import _engine
+
+        assert not _engine._started
+        if _engine.execution_engine == "Ray":
+            import ray
+
+            assert not ray.is_initialized()
+        """
+    )
+
+
+@pytest.mark.skipif(execution_engine == "Python", reason="Nothing to start")
+def test_engine_is_started_once():
+    _run_in_new_process(
+        """
+        import modin.pandas as pd
+        from modin.pandas import _engine
+
+        if _engine.execution_engine == "Ray":
+            pd.initialize_ray()
+        else:
+            pd.start_engine()
+
+        def fail(*args, **kwargs):
+            raise AssertionError("The engine was initialized again")
+
+        _engine.initialize_ray = _engine.initialize_dask = fail
+        pd.start_engine()
+        pd.DataFrame([1, 2, 3])
+        """
+    )
+
+
+@pytest.mark.skipif(execution_engine == "Python", reason="Nothing to start")
+def test_engine_cannot_be_started_from_another_thread():
+    _run_in_new_process(
+        """
+        import threading
+        import modin.pandas as pd
+
+        errors = []
+
+        def first_use():
+            try:
+                pd.DataFrame([1, 2, 3])
+            except RuntimeError as e:
+                errors.append(e)
+
+        thread = threading.Thread(target=first_use)
+        thread.start()
+        thread.join()
+        assert len(errors) == 1 and "main thread" in str(errors[0])
+        """
+    )
+
+
+def test_bound_call_pickle():
+    from modin.engines.base.frame.axis_partition import PandasFrameAxisPartition
+    from modin.engines.ray.utils import BoundCall
+
+    bound_call = BoundCall("deploy_axis_func", PandasFrameAxisPartition)
+    assert (
+        pickle.loads(pickle.dumps(bound_call))
+        == PandasFrameAxisPartition.deploy_axis_func
+    )
+
+
+def test_refresh_cluster_info(monkeypatch):
+    import modin
+    from modin.pandas import _engine
+
+    pd.get_num_cpus()
+    try:
+        monkeypatch.delitem(vars(pd), "DEFAULT_NPARTITIONS", raising=False)
+        monkeypatch.setattr(_engine, "num_cpus", _engine.num_cpus)
+        monkeypatch.setattr(_engine, "_query_cluster", True)
+        monkeypatch.setattr(
+            _engine, "_cluster_cpu", functools.lru_cache(maxsize=1)(lambda: 1000)
+        )
+        pd.refresh_cluster_info()
+        assert modin._default_npartitions is None
+        assert pd.get_num_cpus() == 1000
+        assert _engine.get_default_npartitions() == 1000
+        assert modin._default_npartitions == 1000
+    finally:
+        monkeypatch.undo()
+        pd.refresh_cluster_info()